@@ -18,10 +18,13 @@
 
 import os
 import pkgutil
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def get_package_path(package_name: str) -> str:
-    """Given a python package name, returns the filepath of the package root folder."""
+    """Given a python package name, returns the filepath of the package root folder.
+    The result is cached, as package locations do not change at runtime."""
     package_path = None
     try:
         # We try to deduce the package path from the top-level package
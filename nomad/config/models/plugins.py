@@ -19,12 +19,24 @@
 import os
 import sys
 import shutil
+from copy import deepcopy
+from functools import lru_cache
 from tempfile import TemporaryDirectory
 from abc import ABCMeta, abstractmethod
 import importlib
-from typing import Optional, Dict, Union, List, Literal, TYPE_CHECKING
-import requests
-from pydantic import BaseModel, Field, root_validator
+from typing import (
+    Optional,
+    Dict,
+    Union,
+    List,
+    Literal,
+    Set,
+    Type,
+    ClassVar,
+    FrozenSet,
+    TYPE_CHECKING,
+)
+from pydantic import BaseModel, Field, PrivateAttr, root_validator
 
 from nomad.common import get_package_path
 
@@ -39,7 +51,50 @@ if TYPE_CHECKING:
     from nomad.parsing import Parser as ParserBaseClass
 
 
-class EntryPoint(BaseModel):
+@lru_cache(maxsize=None)
+def _dict_safe_exclude(
+    model: Type[BaseModel], keys: FrozenSet[str]
+) -> Optional[FrozenSet[str]]:
+    """Returns the fields of the given model class that are not part of the given
+    safe keys. Excluding these few fields (or nothing at all, if None) is
+    cheaper for pydantic than including all of the safe keys."""
+    return frozenset(model.__fields__) - keys or None
+
+
+class _DictSafeModel(BaseModel):
+    """Base model for models with a cached `dict_safe` serialization."""
+
+    _DICT_SAFE_KEYS: ClassVar[FrozenSet[str]]
+    _dict_safe_cache: Optional[dict] = PrivateAttr(None)
+
+    def __setattr__(self, name, value):
+        if name not in self.__private_attributes__:
+            self._dict_safe_cache = None
+        super().__setattr__(name, value)
+
+    def _copy_and_set_values(self, *args, **kwargs):
+        # Copies may have different values and must not inherit the cache.
+        model = super()._copy_and_set_values(*args, **kwargs)
+        model._dict_safe_cache = None
+        return model
+
+    def dict_safe(self):
+        """Used to serialize the non-confidential parts of a plugin model. This
+        function can be overridden in subclasses to expose more information.
+        Subclasses can also just define their own `_DICT_SAFE_KEYS`.
+
+        The serialization is cached until a field of the model is changed, and
+        a copy of it is returned.
+        """
+        if self._dict_safe_cache is None:
+            self._dict_safe_cache = self.dict(
+                exclude=_dict_safe_exclude(type(self), self._DICT_SAFE_KEYS),
+                exclude_none=True,
+            )
+        return deepcopy(self._dict_safe_cache)
+
+
+class EntryPoint(_DictSafeModel):
     """Base model for a NOMAD plugin entry points."""
 
     id: Optional[str] = Field(
@@ -54,11 +109,8 @@ class EntryPoint(BaseModel):
         description='The plugin package from which this entry points comes from.'
     )
 
-    def dict_safe(self):
-        """Used to serialize the non-confidential parts of a plugin model. This
-        function can be overridden in subclasses to expose more information.
-        """
-        return self.dict(include=EntryPoint.__fields__.keys(), exclude_none=True)
+
+EntryPoint._DICT_SAFE_KEYS = frozenset(EntryPoint.__fields__)
 
 
 class AppEntryPoint(EntryPoint):
@@ -69,8 +121,8 @@ class AppEntryPoint(EntryPoint):
     )
     app: App = Field(description='The app configuration.')
 
-    def dict_safe(self):
-        return self.dict(include=AppEntryPoint.__fields__.keys(), exclude_none=True)
+
+AppEntryPoint._DICT_SAFE_KEYS = frozenset(AppEntryPoint.__fields__)
 
 
 class SchemaPackageEntryPoint(EntryPoint, metaclass=ABCMeta):
@@ -185,14 +237,40 @@ class ParserEntryPoint(EntryPoint, metaclass=ABCMeta):
         parser class should be done within this function as well."""
         pass
 
-    def dict_safe(self):
-        # The binary data types are removed from the safe serialization: binary
-        # data is not JSON serializable.
-        keys = set(list(ParserEntryPoint.__fields__.keys()))
-        keys.remove('mainfile_binary_header_re')
-        keys.remove('mainfile_binary_header')
 
-        return self.dict(include=keys, exclude_none=True)
+# The binary data types are removed from the safe serialization: binary data is
+# not JSON serializable.
+ParserEntryPoint._DICT_SAFE_KEYS = frozenset(ParserEntryPoint.__fields__) - {
+    'mainfile_binary_header',
+    'mainfile_binary_header_re',
+}
+
+
+@lru_cache(maxsize=None)
+def _download_session():
+    """Returns the session shared by all example upload downloads, so that
+    connections to the same host are pooled and reused."""
+    import requests
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Invalid combinations of the given (path, url, local_path) fields of example
+# uploads, encoded as a 3-bit integer.
+_example_upload_errors = {
+    0b110: 'Provide only "path" or "url", not both.',
+    0b111: 'Provide only "path" or "url", not both.',
+    0b000: 'Provide one of "path", "url" or "local_path".',
+}
 
 
 class ExampleUploadEntryPoint(EntryPoint):
@@ -227,13 +305,14 @@ class ExampleUploadEntryPoint(EntryPoint):
     @root_validator(pre=True)
     def _validate(cls, values):
         """Checks that only either path or url is given."""
-        path = values.get('path')
-        url = values.get('url')
-        local_path = values.get('local_path')
-        if path and url:
-            raise ValueError('Provide only "path" or "url", not both.')
-        if not path and not url and not local_path:
-            raise ValueError('Provide one of "path", "url" or "local_path".')
+        given = (
+            bool(values.get('path')) << 2
+            | bool(values.get('url')) << 1
+            | bool(values.get('local_path'))
+        )
+        error = _example_upload_errors.get(given)
+        if error:
+            raise ValueError(error)
 
         return values
 
@@ -256,6 +335,9 @@ class ExampleUploadEntryPoint(EntryPoint):
             return
         # Create local path from given path or url
         if not path and self.url:
+            import requests
+            import urllib3
+
             final_folder = os.path.join(
                 get_package_path(self.plugin_package), 'example_uploads'
             )
@@ -264,22 +346,23 @@ class ExampleUploadEntryPoint(EntryPoint):
 
             if not os.path.exists(final_filepath):
                 try:
-                    with requests.get(self.url, stream=True) as response:
+                    with _download_session().get(self.url, stream=True) as response:
                         response.raise_for_status()
+                        response.raw.decode_content = True
                         # Download into a temporary directory to ensure the integrity of
-                        # the download
-                        with TemporaryDirectory() as tmp_folder:
+                        # the download. It is placed inside the final folder, so that
+                        # the finished file can be moved instead of copied.
+                        os.makedirs(final_folder, exist_ok=True)
+                        with TemporaryDirectory(dir=final_folder) as tmp_folder:
                             tmp_filepath = os.path.join(tmp_folder, filename)
                             with open(tmp_filepath, mode='wb') as file:
-                                for chunk in response.iter_content(
-                                    chunk_size=10 * 1024
-                                ):
-                                    file.write(chunk)
-                            # If download has succeeeded, copy the files over to
+                                shutil.copyfileobj(
+                                    response.raw, file, length=1024 * 1024
+                                )
+                            # If download has succeeeded, move the file over to
                             # final location
-                            os.makedirs(final_folder, exist_ok=True)
-                            shutil.copy(tmp_filepath, final_filepath)
-                except requests.RequestException as e:
+                            os.replace(tmp_filepath, final_filepath)
+                except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
                     raise ValueError(
                         f'Could not fetch the example upload from URL: {self.url}'
                     ) from e
@@ -292,13 +375,11 @@ class ExampleUploadEntryPoint(EntryPoint):
         prefix = os.path.join(example_upload_path_prefix, self.plugin_package)
         self.local_path = os.path.join(prefix, path)
 
-    def dict_safe(self):
-        return self.dict(
-            include=ExampleUploadEntryPoint.__fields__.keys(), exclude_none=True
-        )
+
+ExampleUploadEntryPoint._DICT_SAFE_KEYS = frozenset(ExampleUploadEntryPoint.__fields__)
 
 
-class PluginBase(BaseModel):
+class PluginBase(_DictSafeModel):
     """
     Base model for a NOMAD plugin.
 
@@ -323,11 +404,8 @@ class PluginBase(BaseModel):
         description='The URL of the plugins main source code repository.'
     )
 
-    def dict_safe(self):
-        """Used to serialize the non-confidential parts of a plugin model. This
-        function can be overridden in subclasses to expose more information.
-        """
-        return self.dict(include=PluginBase.__fields__.keys(), exclude_none=True)
+
+PluginBase._DICT_SAFE_KEYS = frozenset(PluginBase.__fields__)
 
 
 class PythonPluginBase(PluginBase):
@@ -580,13 +658,22 @@ class Plugins(BaseModel):
     )
 
 
+# Paths that were added to sys.path by add_plugin and are removed again by
+# remove_plugin.
+_installed_paths: Set[str] = set()
+
+
 def add_plugin(plugin: Schema) -> None:
     """Function for dynamically adding a plugin."""
     from nomad.config import config
     from nomad.metainfo.elasticsearch_extension import entry_type
 
-    if plugin.package_path not in sys.path:
+    if (
+        plugin.package_path not in _installed_paths
+        and plugin.package_path not in sys.path
+    ):
         sys.path.insert(0, plugin.package_path)
+        _installed_paths.add(plugin.package_path)
 
     # Add plugin to config
     config.plugins.entry_points.options[plugin.key] = plugin
@@ -607,20 +694,21 @@ def remove_plugin(plugin) -> None:
     from nomad.metainfo import Package
 
     # Remove from path
-    try:
-        sys.path.remove(plugin.package_path)
-    except Exception:
-        pass
+    if plugin.package_path in _installed_paths:
+        _installed_paths.discard(plugin.package_path)
+        try:
+            sys.path.remove(plugin.package_path)
+        except ValueError:
+            pass
 
     # Remove package as plugin
     del config.plugins.entry_points.options[plugin.key]
 
     # Remove plugin from Package registry
     package = importlib.import_module(plugin.python_package).m_package
-    for key, i_package in Package.registry.items():
-        if i_package is package:
+    for key in [package.name, *package.aliases]:
+        if Package.registry.get(key) is package:
             del Package.registry[key]
-            break
 
     # Reload the dynamic quantities so that API is aware of the plugin
     # quantities.
@@ -232,6 +232,9 @@ class MatchingParser(Parser):
         self._mainfile_binary_header = mainfile_binary_header
         self._mainfile_mime_re = re.compile(mainfile_mime_re)
         self._mainfile_name_re = re.compile(mainfile_name_re)
+        # The default r'.*' patterns are checked without the regex engine.
+        self._mainfile_mime_matches_all = mainfile_mime_re == r'.*'
+        self._mainfile_name_matches_all = mainfile_name_re == r'.*'
         self._mainfile_alternative = mainfile_alternative
 
         # Assign private variable this way to avoid static check issue.
@@ -262,6 +265,13 @@ class MatchingParser(Parser):
 
         return parser_metadata
 
+    def _is_mainfile_name(self, filename: str) -> bool:
+        if self._mainfile_name_matches_all:
+            # r'.*' fully matches every name without a line break
+            return '\n' not in filename
+
+        return self._mainfile_name_re.fullmatch(filename) is not None
+
     def is_mainfile(
         self,
         filename: str,
@@ -288,13 +298,14 @@ class MatchingParser(Parser):
             else:
                 return False
 
-        if self._mainfile_mime_re.match(mime) is None:
-            return False
+        if not self._mainfile_mime_matches_all:
+            if self._mainfile_mime_re.match(mime) is None:
+                return False
 
         if compression is not None and compression not in self._supported_compressions:
             return False
 
-        if self._mainfile_name_re.fullmatch(filename) is None:
+        if not self._is_mainfile_name(filename):
             if not self._mainfile_alternative:
                 return False
 
@@ -303,7 +314,7 @@ class MatchingParser(Parser):
                 sibling = os.path.join(directory, sibling)
                 sibling_is_mainfile = (
                     sibling != filename
-                    and self._mainfile_name_re.fullmatch(sibling) is not None
+                    and self._is_mainfile_name(sibling)
                     and os.path.isfile(sibling)
                 )
                 if sibling_is_mainfile:
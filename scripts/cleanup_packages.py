@@ -1,5 +1,7 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
 import pandas as pd
 from packaging import version
@@ -17,31 +19,50 @@ CI_JOB_TOKEN = get_env_var('CI_JOB_TOKEN')
 CI_PROJECT_ID = get_env_var('CI_PROJECT_ID')
 
 NB_PACKAGES_PER_PAGE = 100
+NB_FETCH_WORKERS = 16
+
+
+def get_packages_page(session, url):
+    response = session.get(url, headers={'JOB-TOKEN': CI_JOB_TOKEN})
+    print(response)
+
+    if response.status_code != 200:
+        print('Unable to list Gitlab packages, no cleanup can be done')
+        sys.exit(1)
+
+    return response
 
 
 def fetch_packages():
+    def page_link(page):
+        return f'https://gitlab.mpcdf.mpg.de/api/v4/projects/{CI_PROJECT_ID}/packages?page={page}&per_page={NB_PACKAGES_PER_PAGE}&order_by=created_at&sort=asc'
+
     packages = []
-    hasNext = True
-    nextLink = f'https://gitlab.mpcdf.mpg.de/api/v4/projects/{CI_PROJECT_ID}/packages?page=1&per_page={NB_PACKAGES_PER_PAGE}&order_by=created_at&sort=asc'
-    job_token = {'JOB-TOKEN': CI_JOB_TOKEN}
-    while hasNext and nextLink:
-        response = requests.get(nextLink, headers=job_token)
-        print(response)
-
-        if response.status_code != 200:
-            print('Unable to list Gitlab packages, no cleanup can be done')
-            sys.exit(1)
-
-        packages.extend(response.json())
-        nextLink = None
-        links = response.headers.get('Link', '')
-        if 'rel="next"' in links:
-            links_parts = links.split(',')
-            for part in links_parts:
-                if 'rel="next"' in part:
-                    nextLink = part[part.find('<') + 1 : part.find('>')]
-                    break
-        hasNext = nextLink is not None
+    with requests.Session() as session:
+        # Allow one pooled connection per worker, so they are all kept alive
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=NB_FETCH_WORKERS)
+        session.mount('https://', adapter)
+
+        response = get_packages_page(session, page_link(1))
+        packages.extend(orjson.loads(response.content))
+
+        total_pages = response.headers.get('X-Total-Pages')
+        if total_pages:
+            with ThreadPoolExecutor(max_workers=NB_FETCH_WORKERS) as executor:
+                responses = executor.map(
+                    lambda page: get_packages_page(session, page_link(page)),
+                    range(2, int(total_pages) + 1),
+                )
+                for response in responses:
+                    packages.extend(orjson.loads(response.content))
+        else:
+            # Gitlab omits the total number of pages for very large collections,
+            # in this case the pages have to be followed one by one.
+            nextLink = response.links.get('next', {}).get('url')
+            while nextLink:
+                response = get_packages_page(session, nextLink)
+                packages.extend(orjson.loads(response.content))
+                nextLink = response.links.get('next', {}).get('url')
 
     return pd.DataFrame(packages)
 
@@ -75,31 +96,36 @@ def find_packages_to_delete(packages: pd.DataFrame):
             {'name': 'pkg1', 'version': '1.3.1.dev678'}
         ]
     """
-    grouped = packages.groupby('name')
-
-    packages_to_delete = []
-
-    for _, group in grouped:
-        # Convert version strings to version objects for comparison
-        group['parsed_version'] = group['version'].apply(version.parse)
-        sorted_group = group.sort_values(by='parsed_version', ascending=False)
-        # Find the non-dev versions
-        latest_non_dev = sorted_group[
-            ~sorted_group['parsed_version'].apply(lambda x: x.is_prerelease)
-        ]
-        if len(latest_non_dev) < 2:
-            continue
-        # Find the second latest non dev version. (eg: given 1.3.3, 1.3.2, 1.3.1, we want: 1.3.2)
-        second_latest_non_dev = latest_non_dev.iloc[1]
-        second_latest_non_dev_version = second_latest_non_dev['parsed_version']
-        # Add dev versions older than the second latest non-dev version to the delete list
-        # (eg: 1.3.3, 1.3.3.dev123, 1.3.2, 1.3.2.dev456, 1.3.1, 1.3.1.dev678 -> [1.3.2.dev456, 1.3.1.dev678])
-        dev_versions_to_delete = sorted_group[
-            (sorted_group['parsed_version'] < second_latest_non_dev_version)
-            & (sorted_group['parsed_version'].apply(lambda x: x.is_prerelease))
-        ]
-        packages_to_delete.extend(dev_versions_to_delete.to_dict('records'))
-    return packages_to_delete
+    # Convert version strings to version objects once for all packages. The distinct
+    # versions are ranked once, so that sorting and comparing happens on integers.
+    parsed_version = packages['version'].map(version.parse)
+    unique_versions = sorted(set(parsed_version))
+    version_rank = {v: rank for rank, v in enumerate(unique_versions)}
+    sorted_packages = packages.assign(
+        parsed_version=parsed_version,
+        version_rank=parsed_version.map(version_rank).astype('int64'),
+    ).sort_values(by=['name', 'version_rank'], ascending=[True, False])
+    is_prerelease = (
+        sorted_packages['parsed_version']
+        .map({v: v.is_prerelease for v in unique_versions})
+        .astype(bool)
+    )
+
+    # Find the second latest non dev version of each package. (eg: given 1.3.3, 1.3.2,
+    # 1.3.1, we want: 1.3.2)
+    non_dev = sorted_packages[~is_prerelease]
+    second_latest_non_dev = non_dev[non_dev.groupby('name').cumcount() == 1]
+    threshold = sorted_packages['name'].map(
+        second_latest_non_dev.set_index('name')['version_rank']
+    )
+
+    # Select dev versions older than the second latest non-dev version to delete
+    # (eg: 1.3.3, 1.3.3.dev123, 1.3.2, 1.3.2.dev456, 1.3.1, 1.3.1.dev678 -> [1.3.2.dev456, 1.3.1.dev678])
+    # Packages without a second latest non-dev version have a NaN threshold, which
+    # never compares as older.
+    is_older = sorted_packages['version_rank'] < threshold
+    packages_to_delete = sorted_packages[is_older & is_prerelease]
+    return packages_to_delete.drop(columns='version_rank').to_dict('records')
 
 
 def delete_old_packages(packages_to_delete: list[dict]):
@@ -137,7 +163,7 @@ def delete_old_packages(packages_to_delete: list[dict]):
 
     for package_info in packages_to_delete:
         package_id = package_info['id']
-        package_info_label = f"{package_info['name']} - v{package_info['version']}"
+        package_info_label = f'{package_info["name"]} - v{package_info["version"]}'
         print(f'Deleting package {package_info_label}')
         url = f'https://gitlab.mpcdf.mpg.de/api/v4/projects/{CI_PROJECT_ID}/packages/{package_id}'
         try:
@@ -117,3 +117,25 @@ def test_example_upload_entry_point_invalid(config, error, monkeypatch):
             entry_point.load()
 
         assert exc_info.match(error)
+
+
+def test_dict_safe_cache(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp_dir_path:
+        mock_plugin_package(monkeypatch, tmp_dir_path)
+        entry_point = ExampleUploadEntryPoint(
+            title='test',
+            description='test',
+            category='test',
+            path='example_uploads/getting_started',
+            plugin_package='nomad_test_plugin',
+        )
+        assert 'local_path' not in entry_point.dict_safe()
+        entry_point.dict_safe()['title'] = 'changed'
+        assert entry_point.dict_safe()['title'] == 'test'
+
+        entry_point.load()
+        assert entry_point.dict_safe()['local_path'] == entry_point.local_path
+
+        copied = entry_point.copy(update={'title': 'copied'})
+        assert copied.dict_safe()['title'] == 'copied'
+        assert entry_point.dict_safe()['title'] == 'test'
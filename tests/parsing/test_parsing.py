@@ -18,6 +18,7 @@
 
 import json
 import os
+import re
 from shutil import copyfile
 from unittest.mock import patch, MagicMock
 
@@ -397,6 +398,32 @@ def test_is_mainfile_with_mocked_content(
                 assert result == expected_result
 
 
+@pytest.mark.parametrize(
+    'mainfile_name_re, mainfile_mime_re',
+    [
+        pytest.param(r'.*', r'.*', id='match-all'),
+        pytest.param(r'.*\.json', r'application/.*', id='patterns'),
+    ],
+)
+@pytest.mark.parametrize(
+    'filename, mime',
+    [
+        pytest.param('dir/file.json', 'application/json', id='json'),
+        pytest.param('dir/file.txt', 'text/plain', id='text'),
+        pytest.param('dir/file\n.json', '', id='line-break'),
+    ],
+)
+def test_is_mainfile_name_and_mime(mainfile_name_re, mainfile_mime_re, filename, mime):
+    parser = MatchingParser(
+        mainfile_name_re=mainfile_name_re, mainfile_mime_re=mainfile_mime_re
+    )
+    expected = (
+        re.fullmatch(mainfile_name_re, filename) is not None
+        and re.match(mainfile_mime_re, mime) is not None
+    )
+    assert parser.is_mainfile(filename, mime, buffer=b'', decoded_buffer='') == expected
+
+
 if __name__ == '__main__':
     import os
     import sys